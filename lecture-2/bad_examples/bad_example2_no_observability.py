@@ -40,7 +40,7 @@ class UnobservableSystem:
     def __init__(self):
         self.internal_state = {}  # Hidden state
         self.errors = []  # But errors are never logged!
-        self.performance_data = {}  # But never measured!
+        self.performance_data = {}  # Nanoseconds, but never reported!
         self.user_requests = 0  # But never tracked!
         self.failures = 0  # But never reported!
         self.no_logging = True
@@ -59,7 +59,7 @@ class UnobservableSystem:
         - Can't see what's happening
         """
         # Process request (but we can't see what happens!)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Simulate processing
         processing_time = random.uniform(0.1, 2.0)
@@ -75,10 +75,10 @@ class UnobservableSystem:
             return {"success": False, "error": "Unknown error"}
         
         self.user_requests += 1
-        elapsed = time.time() - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         # Performance data exists but never measured!
-        self.performance_data[request_data.get("id")] = elapsed
+        self.performance_data[request_data.get("id")] = elapsed_ns
         
         # Request processed but no logging!
         return {"success": True, "data": "processed"}
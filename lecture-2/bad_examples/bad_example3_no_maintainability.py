@@ -19,6 +19,9 @@ from datetime import datetime, timedelta
 import time
 
 
+_SEPARATOR = "=" * 70
+
+
 # ============================================================================
 # BAD: No maintainability - technical debt explosion
 # ============================================================================
@@ -82,9 +85,9 @@ class UnmaintainableSystem:
         - Missing features
         - Can't use new libraries
         """
-        print("\n" + "=" * 70)
+        print("\n" + _SEPARATOR)
         print("DEPENDENCY UPDATE AVAILABLE")
-        print("=" * 70)
+        print(_SEPARATOR)
         print(f"""
         ⚠️  New version available: 2.1.0
         ⚠️  Current version: {self.dependency_version} (outdated!)
@@ -112,9 +115,9 @@ class UnmaintainableSystem:
         - Can't handle growth
         - Technical debt increases
         """
-        print("\n" + "=" * 70)
+        print("\n" + _SEPARATOR)
         print("PERFORMANCE ISSUES REPORTED")
-        print("=" * 70)
+        print(_SEPARATOR)
         print("""
         ⚠️  Users report: "System is slow"
         ⚠️  Response time: 2.5s (target: <1s)
@@ -142,9 +145,9 @@ class UnmaintainableSystem:
         - Can't add features
         - Can't fix bugs safely
         """
-        print("\n" + "=" * 70)
+        print("\n" + _SEPARATOR)
         print("CODE QUALITY ISSUES")
-        print("=" * 70)
+        print(_SEPARATOR)
         print(f"""
         ⚠️  Code complexity: {self.code_complexity} (target: <10)
         ⚠️  Technical debt: {self.technical_debt:.0f} hours
@@ -184,63 +187,7 @@ class UnmaintainableSystem:
 # DEMONSTRATION: Why This Is Bad
 # ============================================================================
 
-def demonstrate_no_maintainability():
-    """
-    Demonstrate the problems with no maintainability
-    """
-    print("=" * 70)
-    print("BAD EXAMPLE 3: No Maintainability - Technical Debt Explosion")
-    print("=" * 70)
-    print("\n❌ PROBLEMS WITH NO MAINTAINABILITY:")
-    print("   1. Only fixes critical bugs")
-    print("   2. Ignores dependency updates")
-    print("   3. No performance improvements")
-    print("   4. No refactoring")
-    print("   5. Technical debt explodes")
-    print("   6. System becomes unmaintainable")
-    
-    system = UnmaintainableSystem()
-    
-    print("\n" + "=" * 70)
-    print("INITIAL SYSTEM HEALTH")
-    print("=" * 70)
-    health = system.get_system_health()
-    for key, value in health.items():
-        print(f"   {key.replace('_', ' ').title()}: {value}")
-    
-    print("\n" + "=" * 70)
-    print("SIMULATING 6 MONTHS OF POOR MAINTENANCE")
-    print("=" * 70)
-    
-    # Simulate 6 months
-    for month in range(6):
-        print(f"\n📅 Month {month + 1}:")
-        
-        # Only fix critical bugs
-        system.only_fix_critical_bugs("Critical: System crash on startup")
-        system.only_fix_critical_bugs("Minor: UI typo")
-        system.only_fix_critical_bugs("Medium: Slow search")
-        
-        # Ignore dependency updates
-        system.ignore_dependency_updates()
-        
-        # No performance improvements
-        system.no_performance_improvements()
-        
-        # No refactoring
-        system.no_refactoring()
-    
-    print("\n" + "=" * 70)
-    print("SYSTEM HEALTH AFTER 6 MONTHS")
-    print("=" * 70)
-    health = system.get_system_health()
-    for key, value in health.items():
-        print(f"   {key.replace('_', ' ').title()}: {value}")
-    
-    print("\n" + "=" * 70)
-    print("SCENARIO: Try to Add New Feature")
-    print("=" * 70)
-    print("""
+_SCENARIO_NEW_FEATURE = """
     Product manager: "We need to add payment integration"
     
     With this system:
@@ -251,12 +198,9 @@ def demonstrate_no_maintainability():
     5. Takes 3 months instead of 2 weeks
     
     Result: Feature delayed, costs explode, users frustrated!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("SCENARIO: Security Vulnerability Found")
-    print("=" * 70)
-    print("""
+    """
+
+_SCENARIO_SECURITY_VULNERABILITY = """
     Security team: "Critical vulnerability in dependency"
     
     With this system:
@@ -267,12 +211,9 @@ def demonstrate_no_maintainability():
     5. Takes weeks to fix
     
     Result: System vulnerable, compliance issues, potential breach!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("SCENARIO: Performance Issues")
-    print("=" * 70)
-    print("""
+    """
+
+_SCENARIO_PERFORMANCE_ISSUES = """
     Users: "System is too slow, we're leaving"
     
     With this system:
@@ -283,12 +224,9 @@ def demonstrate_no_maintainability():
     5. Must rewrite to fix
     
     Result: Users leave, revenue lost, must rewrite!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("COMPARE TO: Good Maintainability (example5_maintainability.py)")
-    print("=" * 70)
-    print("""
+    """
+
+_COMPARE_GOOD_MAINTAINABILITY = """
     With good maintainability:
     
     ✅ Corrective: Fix bugs regularly
@@ -301,12 +239,9 @@ def demonstrate_no_maintainability():
     • 20 hours debt (vs 500+)
     • 90% performance (vs 60%)
     • 85% maintainability (vs 30%)
-    """)
-    
-    print("\n" + "=" * 70)
-    print("REAL-WORLD IMPACT")
-    print("=" * 70)
-    print("""
+    """
+
+_REAL_WORLD_IMPACT = """
     Company with no maintainability:
     
     After 1 year:
@@ -331,7 +266,88 @@ def demonstrate_no_maintainability():
     • Low technical debt
     • Good performance
     • Secure and up-to-date
-    """)
+    """
+
+
+def demonstrate_no_maintainability():
+    """
+    Demonstrate the problems with no maintainability
+    """
+    system = UnmaintainableSystem()
+    
+    # Collect each run of output and print it in one call
+    lines = [
+        _SEPARATOR,
+        "BAD EXAMPLE 3: No Maintainability - Technical Debt Explosion",
+        _SEPARATOR,
+        "\n❌ PROBLEMS WITH NO MAINTAINABILITY:",
+        "   1. Only fixes critical bugs",
+        "   2. Ignores dependency updates",
+        "   3. No performance improvements",
+        "   4. No refactoring",
+        "   5. Technical debt explodes",
+        "   6. System becomes unmaintainable",
+        "\n" + _SEPARATOR,
+        "INITIAL SYSTEM HEALTH",
+        _SEPARATOR,
+    ]
+    health = system.get_system_health()
+    lines.extend(f"   {key.replace('_', ' ').title()}: {value}" for key, value in health.items())
+    lines += [
+        "\n" + _SEPARATOR,
+        "SIMULATING 6 MONTHS OF POOR MAINTENANCE",
+        _SEPARATOR,
+    ]
+    print("\n".join(lines))
+    
+    # Simulate 6 months
+    for month in range(6):
+        print(f"\n📅 Month {month + 1}:")
+        
+        # Only fix critical bugs
+        system.only_fix_critical_bugs("Critical: System crash on startup")
+        system.only_fix_critical_bugs("Minor: UI typo")
+        system.only_fix_critical_bugs("Medium: Slow search")
+        
+        # Ignore dependency updates
+        system.ignore_dependency_updates()
+        
+        # No performance improvements
+        system.no_performance_improvements()
+        
+        # No refactoring
+        system.no_refactoring()
+    
+    lines = [
+        "\n" + _SEPARATOR,
+        "SYSTEM HEALTH AFTER 6 MONTHS",
+        _SEPARATOR,
+    ]
+    health = system.get_system_health()
+    lines.extend(f"   {key.replace('_', ' ').title()}: {value}" for key, value in health.items())
+    lines += [
+        "\n" + _SEPARATOR,
+        "SCENARIO: Try to Add New Feature",
+        _SEPARATOR,
+        _SCENARIO_NEW_FEATURE,
+        "\n" + _SEPARATOR,
+        "SCENARIO: Security Vulnerability Found",
+        _SEPARATOR,
+        _SCENARIO_SECURITY_VULNERABILITY,
+        "\n" + _SEPARATOR,
+        "SCENARIO: Performance Issues",
+        _SEPARATOR,
+        _SCENARIO_PERFORMANCE_ISSUES,
+        "\n" + _SEPARATOR,
+        "COMPARE TO: Good Maintainability (example5_maintainability.py)",
+        _SEPARATOR,
+        _COMPARE_GOOD_MAINTAINABILITY,
+        "\n" + _SEPARATOR,
+        "REAL-WORLD IMPACT",
+        _SEPARATOR,
+        _REAL_WORLD_IMPACT,
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
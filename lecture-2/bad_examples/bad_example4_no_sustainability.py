@@ -17,6 +17,9 @@ from datetime import datetime, timedelta
 import time
 
 
+_SEPARATOR = "=" * 70
+
+
 # ============================================================================
 # BAD: No sustainability - death by success
 # ============================================================================
@@ -65,9 +68,9 @@ class UnsustainableStartup:
         - High obsolescence risk
         - Technical debt explodes
         """
-        print("\n" + "=" * 70)
+        print("\n" + _SEPARATOR)
         print("TECHNICAL SUSTAINABILITY (NEGLECTED)")
-        print("=" * 70)
+        print(_SEPARATOR)
         print(f"""
         ❌ Dependency version: {self.dependency_version} (2 years old!)
         ❌ Last update: {self.last_update.strftime('%Y-%m-%d')}
@@ -97,9 +100,9 @@ class UnsustainableStartup:
         - Burning money
         - No path to profitability
         """
-        print("\n" + "=" * 70)
+        print("\n" + _SEPARATOR)
         print("ECONOMIC SUSTAINABILITY (NEGLECTED)")
-        print("=" * 70)
+        print(_SEPARATOR)
         print(f"""
         ❌ Revenue: ${self.revenue:,.0f}/month (ZERO!)
         ❌ Costs: ${self.costs:,.0f}/month
@@ -130,9 +133,9 @@ class UnsustainableStartup:
         - Can't scale architecture
         - Infrastructure costs explode
         """
-        print("\n" + "=" * 70)
+        print("\n" + _SEPARATOR)
         print("GROWTH SUSTAINABILITY (UNSUSTAINABLE)")
-        print("=" * 70)
+        print(_SEPARATOR)
         print(f"""
         ⚠️  Users: {self.user_count:,}
         ⚠️  Growth: {self.growth_rate:.0f}%/month (too fast!)
@@ -161,9 +164,9 @@ class UnsustainableStartup:
     def simulate_month(self):
         """Simulate one month"""
         self.months_operating += 1
-        print(f"\n{'=' * 70}")
+        print(f"\n{_SEPARATOR}")
         print(f"MONTH {self.months_operating}")
-        print(f"{'=' * 70}")
+        print(_SEPARATOR)
         
         self.ignore_technical_sustainability()
         self.ignore_economic_sustainability()
@@ -207,43 +210,7 @@ class UnsustainableStartup:
 # DEMONSTRATION: Why This Is Bad
 # ============================================================================
 
-def demonstrate_no_sustainability():
-    """
-    Demonstrate the problems with no sustainability
-    """
-    print("=" * 70)
-    print("BAD EXAMPLE 4: No Sustainability - Death by Success")
-    print("=" * 70)
-    print("\n❌ PROBLEMS WITH NO SUSTAINABILITY:")
-    print("   1. No technical sustainability - outdated technology")
-    print("   2. No economic sustainability - no monetization")
-    print("   3. No growth sustainability - can't scale")
-    print("   4. 'Death by success' - success kills the business")
-    
-    startup = UnsustainableStartup()
-    
-    print("\n" + "=" * 70)
-    print("INITIAL STATE")
-    print("=" * 70)
-    report = startup.get_sustainability_report()
-    for dimension, metrics in report.items():
-        print(f"\n{dimension.upper().replace('_', ' ')}:")
-        for key, value in metrics.items():
-            print(f"   {key.replace('_', ' ').title()}: {value}")
-    
-    print("\n" + "=" * 70)
-    print("SIMULATING 6 MONTHS")
-    print("=" * 70)
-    
-    # Simulate months until failure
-    for month in range(6):
-        if not startup.simulate_month():
-            break
-    
-    print("\n" + "=" * 70)
-    print("SCENARIO: Service Goes Viral")
-    print("=" * 70)
-    print("""
+_SCENARIO_VIRAL = """
     Service goes viral - 50% growth per month!
     
     Month 1: 10,000 users
@@ -260,12 +227,9 @@ def demonstrate_no_sustainability():
     • Infrastructure costs explode
     
     Result: "Death by success" - success kills the business!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("SCENARIO: Technical Debt Accumulates")
-    print("=" * 70)
-    print("""
+    """
+
+_SCENARIO_TECHNICAL_DEBT = """
     Technical sustainability ignored:
     
     • Dependencies 2 years old
@@ -280,12 +244,9 @@ def demonstrate_no_sustainability():
     • Must rewrite soon
     
     Result: Technical debt makes system unmaintainable!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("SCENARIO: No Monetization")
-    print("=" * 70)
-    print("""
+    """
+
+_SCENARIO_NO_MONETIZATION = """
     Economic sustainability ignored:
     
     • No revenue model
@@ -300,12 +261,9 @@ def demonstrate_no_sustainability():
     • Will run out of money
     
     Result: Startup fails even with many users!
-    """)
-    
-    print("\n" + "=" * 70)
-    print("COMPARE TO: Sustainable Startup (example6_sustainability.py)")
-    print("=" * 70)
-    print("""
+    """
+
+_COMPARE_SUSTAINABLE_STARTUP = """
     With sustainability:
     
     ✅ Technical: Regular updates, low debt
@@ -316,12 +274,9 @@ def demonstrate_no_sustainability():
     • Profitable and growing
     • Can scale cost-effectively
     • Long-term viability
-    """)
-    
-    print("\n" + "=" * 70)
-    print("REAL-WORLD IMPACT")
-    print("=" * 70)
-    print("""
+    """
+
+_REAL_WORLD_IMPACT = """
     Unsustainable startup:
     
     • Technical: Outdated, vulnerable, high debt
@@ -345,7 +300,68 @@ def demonstrate_no_sustainability():
     • Profitable from month 3
     • Can scale cost-effectively
     • Long-term success
-    """)
+    """
+
+
+def demonstrate_no_sustainability():
+    """
+    Demonstrate the problems with no sustainability
+    """
+    startup = UnsustainableStartup()
+    
+    # Collect each run of output and print it in one call
+    lines = [
+        _SEPARATOR,
+        "BAD EXAMPLE 4: No Sustainability - Death by Success",
+        _SEPARATOR,
+        "\n❌ PROBLEMS WITH NO SUSTAINABILITY:",
+        "   1. No technical sustainability - outdated technology",
+        "   2. No economic sustainability - no monetization",
+        "   3. No growth sustainability - can't scale",
+        "   4. 'Death by success' - success kills the business",
+        "\n" + _SEPARATOR,
+        "INITIAL STATE",
+        _SEPARATOR,
+    ]
+    report = startup.get_sustainability_report()
+    for dimension, metrics in report.items():
+        lines.append(f"\n{dimension.upper().replace('_', ' ')}:")
+        lines.extend(f"   {key.replace('_', ' ').title()}: {value}" for key, value in metrics.items())
+    lines += [
+        "\n" + _SEPARATOR,
+        "SIMULATING 6 MONTHS",
+        _SEPARATOR,
+    ]
+    print("\n".join(lines))
+    
+    # Simulate months until failure
+    for month in range(6):
+        if not startup.simulate_month():
+            break
+    
+    lines = [
+        "\n" + _SEPARATOR,
+        "SCENARIO: Service Goes Viral",
+        _SEPARATOR,
+        _SCENARIO_VIRAL,
+        "\n" + _SEPARATOR,
+        "SCENARIO: Technical Debt Accumulates",
+        _SEPARATOR,
+        _SCENARIO_TECHNICAL_DEBT,
+        "\n" + _SEPARATOR,
+        "SCENARIO: No Monetization",
+        _SEPARATOR,
+        _SCENARIO_NO_MONETIZATION,
+        "\n" + _SEPARATOR,
+        "COMPARE TO: Sustainable Startup (example6_sustainability.py)",
+        _SEPARATOR,
+        _COMPARE_SUSTAINABLE_STARTUP,
+        "\n" + _SEPARATOR,
+        "REAL-WORLD IMPACT",
+        _SEPARATOR,
+        _REAL_WORLD_IMPACT,
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
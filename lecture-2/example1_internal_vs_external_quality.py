@@ -113,18 +113,19 @@ class WellArchitectedECommercePlatform:
     
     def add_feature(self, feature_name: str) -> bool:
         """Add a new feature - fast because of good internal quality"""
-        print(f"  ✅ Adding feature: {feature_name}")
-        
         # Good internal quality = fast development
         development_time = 2.0  # 2 days (fast!)
         test_time = 0.5  # Well-tested code
         review_time = self.internal_quality.code_review_time
         
         total_time = development_time + test_time + review_time
-        print(f"     Development: {development_time} days")
-        print(f"     Testing: {test_time} days")
-        print(f"     Review: {review_time} hours")
-        print(f"     Total: {total_time:.1f} days")
+        print(
+            f"  ✅ Adding feature: {feature_name}\n"
+            f"     Development: {development_time} days\n"
+            f"     Testing: {test_time} days\n"
+            f"     Review: {review_time} hours\n"
+            f"     Total: {total_time:.1f} days"
+        )
         
         self.features_deployed += 1
         return True
@@ -192,8 +193,6 @@ class PoorlyArchitectedECommercePlatform:
     
     def add_feature(self, feature_name: str) -> bool:
         """Add a new feature - slow because of poor internal quality"""
-        print(f"  ⚠️  Adding feature: {feature_name}")
-        
         # Poor internal quality = slow development
         development_time = 8.0  # 8 days (4x slower!)
         test_time = 2.0  # More bugs to fix
@@ -204,11 +203,14 @@ class PoorlyArchitectedECommercePlatform:
         bug_fix_time = bugs * 1.5  # 1.5 days per bug
         
         total_time = development_time + test_time + review_time + bug_fix_time
-        print(f"     Development: {development_time} days")
-        print(f"     Testing: {test_time} days")
-        print(f"     Review: {review_time} hours")
-        print(f"     Bug fixes: {bug_fix_time} days ({bugs} bugs)")
-        print(f"     Total: {total_time:.1f} days")
+        print(
+            f"  ⚠️  Adding feature: {feature_name}\n"
+            f"     Development: {development_time} days\n"
+            f"     Testing: {test_time} days\n"
+            f"     Review: {review_time} hours\n"
+            f"     Bug fixes: {bug_fix_time} days ({bugs} bugs)\n"
+            f"     Total: {total_time:.1f} days"
+        )
         
         self.features_deployed += 1
         self.bugs_introduced += bugs